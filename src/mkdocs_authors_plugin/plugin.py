@@ -1,4 +1,5 @@
 import os
+from collections import namedtuple
 import yaml
 from mkdocs.plugins import BasePlugin, get_plugin_logger
 from mkdocs.config import config_options as c
@@ -7,6 +8,26 @@ from mkdocs.structure.files import File
 
 log = get_plugin_logger(__name__)
 
+# Prefer the libyaml-backed loader when PyYAML was built with it.
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# A rendered authors page, the authors file bytes it was rendered from, and
+# the warnings logged while loading it, which are logged again on every reuse.
+_CachedPage = namedtuple("_CachedPage", "mtime_ns size raw_bytes markdown warnings")
+
+# _CachedPage entries keyed by (authors file path, page_params_key). Kept at
+# module level because `mkdocs serve` creates a fresh plugin instance for
+# every rebuild.
+_authors_page_cache = {}
+
+# (author key, link label, profile URL prefix), in the order links are shown.
+_SOCIAL_LINKS = (
+    ("github", "GitHub", "https://github.com/"),
+    ("linkedin", "LinkedIn", "https://www.linkedin.com/in/"),
+    ("twitter", "Twitter", "https://twitter.com/"),
+    ("orcid", "ORCID", "https://orcid.org/"),
+)
+
 
 class AuthorsPlugin(BasePlugin):
     """
@@ -19,58 +40,137 @@ class AuthorsPlugin(BasePlugin):
         ("page_params_key", c.Type(str, default="page_params")),
     )
 
+    # Set by on_config, or by the first hook called without it.
+    _authors_path = None
+    _output_page = None
+
+    def on_config(self, config):
+        """
+        Resolves the authors file path and output page name once per build.
+        """
+        self._resolve_paths(config)
+        return config
+
+    def _resolve_paths(self, config):
+        """Resolves the absolute authors file path and the output page name."""
+        self._authors_path = os.path.abspath(
+            os.path.join(config["docs_dir"], "..", self.config["authors_file"])
+        )
+        self._output_page = self.config["output_page"]
+
     def on_pre_build(self, config):
         """
         Generates the authors page content from the YAML file before the build.
         """
-        authors_file_path = os.path.join(
-            config["docs_dir"], "..", self.config["authors_file"]
-        )
+        if self._authors_path is None:
+            self._resolve_paths(config)
+        authors_file_path = self._authors_path
         authors_data = []
         page_parameters = {}
 
-        if not os.path.exists(authors_file_path):
+        try:
+            stat = os.stat(authors_file_path)
+        except OSError:
+            # As with os.path.exists, an unreachable path (e.g. through a file
+            # or without permission) counts as missing.
             log.warning(
                 f"Authors file not found at '{authors_file_path}'. No authors page will be generated."
             )
             self.authors_markdown_content = "No authors file found. Please create a '.authors.yml' file in your project root."
             return
 
+        cache_key = (authors_file_path, self.config["page_params_key"])
+        cached = _authors_page_cache.get(cache_key)
+        if (
+            cached is not None
+            and cached.mtime_ns == stat.st_mtime_ns
+            and cached.size == stat.st_size
+        ):
+            self._log_warnings(cached.warnings)
+            self.authors_markdown_content = cached.markdown
+            log.debug(
+                "'%s' is unchanged, reusing the cached authors page.",
+                self.config["authors_file"],
+            )
+            return
+
+        load_error = False
+        warnings = []
         try:
-            with open(authors_file_path, "r", encoding="utf-8") as f:
-                raw_data = yaml.safe_load(f)
+            if stat.st_size:
+                # PyYAML detects the encoding (UTF-8 or a BOM) of bytes input itself.
+                with open(authors_file_path, "rb") as f:
+                    raw_bytes = f.read()
+            else:
+                raw_bytes = b""
+
+            if cached is not None and cached.raw_bytes == raw_bytes:
+                # Touched without being edited (e.g. by a git checkout).
+                _authors_page_cache[cache_key] = cached._replace(
+                    mtime_ns=stat.st_mtime_ns, size=stat.st_size
+                )
+                self._log_warnings(cached.warnings)
+                self.authors_markdown_content = cached.markdown
+                log.debug(
+                    "'%s' content is unchanged, reusing the cached authors page.",
+                    self.config["authors_file"],
+                )
+                return
+
+            # An empty file loads as None, so skip parsing it.
+            raw_data = yaml.load(raw_bytes, Loader=SafeLoader) if raw_bytes else None
 
             if isinstance(raw_data, dict):
                 potential_page_params = raw_data.get(self.config["page_params_key"])
                 if isinstance(potential_page_params, dict):
                     page_parameters = potential_page_params
                 else:
-                    log.warning(
+                    warnings.append(
                         f"'{self.config['page_params_key']}' in '{self.config['authors_file']}' is not a dictionary. Page parameters will be ignored."
                     )
                     page_parameters = {}
 
                 authors_dict = raw_data.get("authors", {})
 
-                if isinstance(authors_dict, dict):
-                    authors_data = [
-                        {"id": aid, **details} for aid, details in authors_dict.items()
-                    ]
-                else:
-                    log.warning(
+                if not isinstance(authors_dict, dict):
+                    warnings.append(
                         f"'{self.config['authors_file']}' does not contain an 'authors' key as a dictionary. No authors will be listed."
                     )
+                elif all(isinstance(details, dict) for details in authors_dict.values()):
+                    # Rendering only reads the parsed mappings, so use them as-is.
+                    authors_data = authors_dict.values()
+                else:
+                    warnings.append(
+                        f"Every entry under 'authors' in '{self.config['authors_file']}' should be a dictionary. No authors will be listed."
+                    )
             else:
-                log.warning(
+                warnings.append(
                     f"'{self.config['authors_file']}' should contain a dictionary at the top level. No authors or page parameters will be loaded."
                 )
         except yaml.YAMLError as e:
+            load_error = True
             log.error(f"Error parsing '{self.config['authors_file']}': {e}")
         except Exception as e:
+            load_error = True
             log.error(f"An unexpected error occurred while loading authors data: {e}")
 
+        self._log_warnings(warnings)
         self._generate_markdown_content(authors_data, page_parameters)
-        log.info(f"Authors page content generated for '{self.config['output_page']}'.")
+        if not load_error:
+            # Errors are not cached so they are reported again on the next build.
+            _authors_page_cache[cache_key] = _CachedPage(
+                mtime_ns=stat.st_mtime_ns,
+                size=stat.st_size,
+                raw_bytes=raw_bytes,
+                markdown=self.authors_markdown_content,
+                warnings=tuple(warnings),
+            )
+        log.debug("Authors page content generated for '%s'.", self._output_page)
+
+    def _log_warnings(self, warnings):
+        """Logs the warnings collected while loading the authors file."""
+        for message in warnings:
+            log.warning(message)
 
     def _generate_markdown_content(self, authors_data, page_parameters):
         """Helper to generate the markdown string."""
@@ -89,73 +189,55 @@ class AuthorsPlugin(BasePlugin):
                 "No authors found or an error occurred while loading the authors data.\n"
             )
         else:
+            # Floated avatars need the text wrap cleared after each author.
+            clear = (
+                '<div style="clear: both;"></div>\n'
+                if avatar_align in ["left", "right"]
+                else ""
+            )
+            avatar_style = self._get_avatar_style(
+                avatar_size, avatar_shape, avatar_align
+            )
+            append = markdown_parts.append
             for author in authors_data:
-                markdown_parts.append(f"## {author.get('name', 'Unknown Author')}\n")
-
-                avatar_html = self._get_avatar_html(
-                    author, avatar_size, avatar_shape, avatar_align
-                )
-                if avatar_align not in [
-                    "left",
-                    "right",
-                ]:  # Center-aligned avatar needs to be handled as a block
-                    if avatar_html:
-                        markdown_parts.append(
-                            f'<p style="text-align: center;">{avatar_html}</p>\n'
-                        )
-                    avatar_html = ""  # Clear for other alignments
-
-                # Add avatar for left/right float and then other details
-                if avatar_html:
-                    markdown_parts.append(avatar_html)
-
-                if author.get("affiliation"):
-                    markdown_parts.append(f"**Affiliation:** {author['affiliation']}\n")
-
-                if author.get("description"):
-                    markdown_parts.append(f"\n{author['description']}\n")
-
-                if author.get("email"):
-                    markdown_parts.append(
-                        f"\n**Email:** [{author['email']}](mailto:{author['email']})\n"
-                    )
-
-                social_links = []
-                if author.get("github"):
-                    social_links.append(
-                        f"[GitHub](https://github.com/{author['github']})"
-                    )
-                if author.get("linkedin"):
-                    social_links.append(
-                        f"[LinkedIn](https://www.linkedin.com/in/{author['linkedin']})"
-                    )
-                if author.get("twitter"):
-                    social_links.append(
-                        f"[Twitter](https://twitter.com/{author['twitter']})"
-                    )
-                if author.get("orcid"):
-                    social_links.append(f"[ORCID](https://orcid.org/{author['orcid']})")
-
-                if social_links:
-                    markdown_parts.append(
-                        "\n**Connect:** " + " | ".join(social_links) + "\n"
+                name = author.get("name", "Unknown Author")
+                affiliation = author.get("affiliation")
+                description = author.get("description")
+                email = author.get("email")
+                avatar = author.get("avatar")
+
+                avatar_html = (
+                    self._get_avatar_html(
+                        avatar, author.get("name", "Avatar"), avatar_style, avatar_align
                     )
+                    if avatar
+                    else ""
+                )
+                affiliation_md = (
+                    f"**Affiliation:** {affiliation}\n" if affiliation else ""
+                )
+                description_md = f"\n{description}\n" if description else ""
+                email_md = f"\n**Email:** [{email}](mailto:{email})\n" if email else ""
+
+                social_links = " | ".join(
+                    [
+                        f"[{label}]({url}{author[key]})"
+                        for key, label, url in _SOCIAL_LINKS
+                        if author.get(key)
+                    ]
+                )
+                connect_md = f"\n**Connect:** {social_links}\n" if social_links else ""
 
-                if avatar_align in ["left", "right"]:
-                    markdown_parts.append('<div style="clear: both;"></div>\n')
-
-                markdown_parts.append("\n---\n\n")
+                append(
+                    f"## {name}\n"
+                    f"{avatar_html}{affiliation_md}{description_md}{email_md}"
+                    f"{connect_md}{clear}\n---\n\n"
+                )
 
         self.authors_markdown_content = "".join(markdown_parts)
 
-    def _get_avatar_html(self, author, size, shape, align):
-        """Generates the HTML for the author's avatar."""
-        if not author.get("avatar"):
-            return ""
-
-        avatar_url = author["avatar"]
-        author_name = author.get("name", "Avatar")
-
+    def _get_avatar_style(self, size, shape, align):
+        """Generates the inline CSS shared by every avatar on the page."""
         style_attributes = f"width: {size}px; height: {size}px; object-fit: cover;"
         style_attributes += (
             " border-radius: 50%;" if shape == "circle" else " border-radius: 0;"
@@ -168,14 +250,27 @@ class AuthorsPlugin(BasePlugin):
         elif align == "center":
             style_attributes += " display: block; margin: 0 auto 10px auto;"
 
-        return f'<img src="{avatar_url}" alt="{author_name} Avatar" style="{style_attributes}">'
+        return style_attributes
+
+    def _get_avatar_html(self, avatar_url, author_name, style_attributes, align):
+        """
+        Generates the HTML for the author's avatar, wrapped in a centered
+        paragraph unless it floats left or right.
+        """
+        img = f'<img src="{avatar_url}" alt="{author_name} Avatar" style="{style_attributes}">'
+        if align in ["left", "right"]:
+            return img
+        # Center-aligned avatar needs to be handled as a block
+        return f'<p style="text-align: center;">{img}</p>\n'
 
     def on_files(self, files, config):
         """
         Ensures the generated authors.md file is included in the MkDocs build.
         """
-        output_page_name = self.config["output_page"]
-        if not any(f.src_path == output_page_name for f in files):
+        if self._output_page is None:
+            self._resolve_paths(config)
+        output_page_name = self._output_page
+        if files.get_file_from_path(output_page_name) is None:
             generated_file = File(
                 path=output_page_name,
                 src_dir=config["docs_dir"],
@@ -183,15 +278,18 @@ class AuthorsPlugin(BasePlugin):
                 use_directory_urls=config["use_directory_urls"],
             )
             files.append(generated_file)
-            log.info(f"Added generated '{output_page_name}' to MkDocs files.")
+            log.debug("Added generated '%s' to MkDocs files.", output_page_name)
         return files
 
     def on_page_read_source(self, page, config):
         """
         Intercepts the generated page and provides its content.
         """
-        output_page_name = self.config["output_page"]
-        if page.file.src_path == output_page_name:
+        if self._output_page is None:
+            self._resolve_paths(config)
+        # Match by path, which also covers File objects rebuilt by plugins that
+        # run after this one.
+        if page.file.src_uri == self._output_page:
             if hasattr(self, "authors_markdown_content"):
                 return self.authors_markdown_content
             else:
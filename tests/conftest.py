@@ -0,0 +1,123 @@
+import pytest
+from mkdocs.config import config_options as c
+from mkdocs.config.base import Config
+from mkdocs.structure.files import File
+from mkdocs.structure.pages import Page
+
+from mkdocs_authors_plugin import plugin as plugin_module
+from mkdocs_authors_plugin.plugin import AuthorsPlugin
+
+
+@pytest.fixture(scope="session")
+def project_dir(tmp_path_factory):
+    """
+    Project root holding the docs and site directories, created once per session.
+    """
+    root = tmp_path_factory.mktemp("mkdocs_root")
+    (root / "docs").mkdir()
+    (root / "site").mkdir()
+    return root
+
+
+@pytest.fixture(scope="session")
+def mkdocs_config(project_dir):
+    """
+    Mock MkDocs config, validated once per session.
+    """
+    config = Config(
+        schema=(
+            ("docs_dir", c.Dir(default="docs")),
+            ("site_dir", c.Dir(default="site")),
+            ("use_directory_urls", c.Type(bool, default=True)),
+            (
+                "plugins",
+                c.ListOfItems(c.Type(str)),
+            ),
+        )
+    )
+    config.load_dict(
+        {
+            "docs_dir": str(project_dir / "docs"),
+            "site_dir": str(project_dir / "site"),
+            "plugins": ["authors_plugin"],
+        }
+    )
+    config.validate()
+    return config
+
+
+@pytest.fixture(scope="session")
+def base_files(mkdocs_config):
+    """
+    Documentation files present before the plugin runs. Tests wrap them in
+    their own Files collection, so the File objects themselves are shared.
+    """
+    docs_dir, site_dir = mkdocs_config["docs_dir"], mkdocs_config["site_dir"]
+    return (
+        File("index.md", docs_dir, site_dir, True),
+        File("about.md", docs_dir, site_dir, True),
+    )
+
+
+@pytest.fixture(scope="session")
+def authors_page(mkdocs_config):
+    """
+    Page for the generated authors.md, as MkDocs would pass it to
+    on_page_read_source. Built once, since the hook only reads it.
+    """
+    authors_file = File(
+        path="authors.md",
+        src_dir=mkdocs_config["docs_dir"],
+        dest_dir=mkdocs_config["site_dir"],
+        use_directory_urls=mkdocs_config["use_directory_urls"],
+    )
+    return Page("authors", authors_file, mkdocs_config)
+
+
+@pytest.fixture
+def make_plugin(mkdocs_config):
+    """
+    Factory for configured AuthorsPlugin instances, as created on each MkDocs build.
+    """
+
+    def make():
+        new_plugin = AuthorsPlugin()
+        new_plugin.load_config(
+            {"authors_file": ".authors.yml", "output_page": "authors.md", "page_params_key": "page_params"}
+        )
+        new_plugin.on_config(mkdocs_config)
+        return new_plugin
+
+    return make
+
+
+@pytest.fixture
+def plugin(make_plugin):
+    return make_plugin()
+
+
+@pytest.fixture
+def authors_yml(project_dir):
+    """
+    Writes the .authors.yml file with given content, removing it after the test.
+    """
+    authors_yml_path = project_dir / ".authors.yml"
+
+    def write(content, encoding="utf-8"):
+        authors_yml_path.write_text(content, encoding=encoding)
+        return authors_yml_path
+
+    yield write
+    if authors_yml_path.exists():
+        authors_yml_path.unlink()
+
+
+@pytest.fixture(autouse=True)
+def clear_authors_page_cache():
+    """
+    Every test shares one .authors.yml path, so rewrites can land within the
+    same mtime tick; start each test with an empty render cache.
+    """
+    plugin_module._authors_page_cache.clear()
+    yield
+    plugin_module._authors_page_cache.clear()
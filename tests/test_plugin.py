@@ -1,92 +1,50 @@
-import unittest
 import os
-import tempfile
-import shutil
-from mkdocs.config import config_options as c
-from mkdocs.config.base import Config
+import re
+from unittest import mock
+
+import pytest
+import yaml
 from mkdocs.structure.files import File, Files
 from mkdocs.structure.pages import Page
 
 # Import the plugin class from your package
+from mkdocs_authors_plugin import plugin as plugin_module
 from mkdocs_authors_plugin.plugin import AuthorsPlugin
 
+DEFAULT_AVATAR_STYLE = 'style="width: 100px; height: 100px; object-fit: cover; border-radius: 0; display: block; margin: 0 auto 10px auto;"'
+
+# Expected in the page rendered by test_authors_page_generation_success.
+SUCCESS_PAGE_FRAGMENTS = (
+    "# Our Amazing Authors",
+    "## Author One",
+    '<img src="headshot_one.png" alt="Author One Avatar"',
+    "**Affiliation:** British Antarctic Survey",
+    "Owner",
+    "**Email:** [author.one@example.com](mailto:author.one@example.com)",
+    "[GitHub](https://github.com/authorone)",
+    "[LinkedIn](https://www.linkedin.com/in/author-one-profile)",
+    "[Twitter](https://twitter.com/author_one_dev)",
+    "[ORCID](https://orcid.org/0123-4567-8910-1112)",
+    "## Author Two",
+    '<img src="headshot_two.png" alt="Author Two Avatar"',
+    "**Affiliation:** UK Centre for Ecology & Hydrology",
+    "Maintainer",
+)
+
+# Minimal valid authors file shared by tests that only need one author.
+SINGLE_AUTHOR_YML = """
+authors:
+  author_one:
+    name: Author One
+"""
 
-class TestAuthorsPlugin(unittest.TestCase):
-    """
-    Test suite for the AuthorsPlugin.
-    """
-
-    def setUp(self):
-        """
-        Set up a temporary directory and mock MkDocs environment for each test.
-        """
-        self.tmp_dir = tempfile.mkdtemp()
-        self.docs_dir = os.path.join(self.tmp_dir, "docs")
-        os.makedirs(self.docs_dir)
-        self.site_dir = os.path.join(self.tmp_dir, "site")
-        os.makedirs(self.site_dir)
-
-        # Mock MkDocs config
-        self.config = Config(
-            schema=(
-                ("docs_dir", c.Dir(default="docs")),
-                ("site_dir", c.Dir(default="site")),
-                ("use_directory_urls", c.Type(bool, default=True)),
-                (
-                    "plugins",
-                    c.ListOfItems(c.Type(str)),
-                ),
-            )
-        )
-        self.config.load_dict(
-            {
-                "docs_dir": self.docs_dir,
-                "site_dir": self.site_dir,
-                "plugins": ["authors_plugin"],
-            }
-        )
-        self.config.validate()
-
-        self.plugin = AuthorsPlugin()
-        self.plugin.load_config(
-            {"authors_file": ".authors.yml", "output_page": "authors.md", "page_params_key": "page_params"}
-        )
 
-    def tearDown(self):
-        """
-        Clean up the temporary directory after each test.
-        """
-        shutil.rmtree(self.tmp_dir)
-
-    def _create_authors_yml(self, content):
-        """
-        Helper function to create the .authors.yml file with given content.
-        """
-        authors_yml_path = os.path.join(self.tmp_dir, ".authors.yml")
-        with open(authors_yml_path, "w", encoding="utf-8") as f:
-            f.write(content)
-        return authors_yml_path
-
-    def _get_generated_authors_md_content(self):
-        """
-        Helper function to simulate how MkDocs would get the content of
-        the generated authors.md file by calling on_page_read_source.
-        """
-        authors_file = File(
-            path="authors.md",
-            src_dir=self.docs_dir,
-            dest_dir=self.site_dir,
-            use_directory_urls=self.config["use_directory_urls"],
-        )
-        authors_page = Page("authors", authors_file, self.config)
-        return self.plugin.on_page_read_source(authors_page, self.config)
-
-    def test_authors_page_generation_success(self):
-        """
-        Test that the authors page is generated correctly with valid data.
-        Verifies default avatar size and shape (100px square, centered).
-        """
-        yml_content = """
+def test_authors_page_generation_success(plugin, mkdocs_config, authors_page, authors_yml):
+    """
+    Test that the authors page is generated correctly with valid data.
+    Verifies default avatar size and shape (100px square, centered).
+    """
+    yml_content = """
 authors:
   author_one:
     name: Author One
@@ -103,385 +61,443 @@ authors:
     description: Maintainer
     avatar: headshot_two.png
     affiliation: UK Centre for Ecology & Hydrology
-        """
-        self._create_authors_yml(yml_content)
-
-        self.plugin.on_pre_build(self.config)
-
-        generated_md = self._get_generated_authors_md_content()
-        self.assertIsNotNone(generated_md)
-        self.assertIn("# Our Amazing Authors", generated_md)
-        self.assertIn("## Author One", generated_md)
-        self.assertIn('<img src="headshot_one.png" alt="Author One Avatar"', generated_md)
-        # Verify default avatar styles (100px square, centered)
-        self.assertIn('style="width: 100px; height: 100px; object-fit: cover; border-radius: 0; display: block; margin: 0 auto 10px auto;"', generated_md)
-        self.assertIn('<p style="text-align: center;">', generated_md) # Check for the wrapper paragraph
-        self.assertIn("**Affiliation:** British Antarctic Survey", generated_md)
-        self.assertIn("Owner", generated_md)
-        self.assertIn(
-            "**Email:** [author.one@example.com](mailto:author.one@example.com)",
-            generated_md,
-        )
-        self.assertIn("[GitHub](https://github.com/authorone)", generated_md)
-        self.assertIn(
-            "[LinkedIn](https://www.linkedin.com/in/author-one-profile)", generated_md
-        )
-        self.assertIn("[Twitter](https://twitter.com/author_one_dev)", generated_md)
-        self.assertIn("[ORCID](https://orcid.org/0123-4567-8910-1112)", generated_md)
-        self.assertIn("## Author Two", generated_md)
-        self.assertIn('<img src="headshot_two.png" alt="Author Two Avatar"', generated_md)
-        # Verify default avatar styles (100px square, centered)
-        self.assertIn('style="width: 100px; height: 100px; object-fit: cover; border-radius: 0; display: block; margin: 0 auto 10px auto;"', generated_md)
-        self.assertIn('<p style="text-align: center;">', generated_md) # Check for the wrapper paragraph
-        self.assertIn("**Affiliation:** UK Centre for Ecology & Hydrology", generated_md)
-        self.assertIn("Maintainer", generated_md)
-        self.assertNotIn("email", generated_md)
-
-    def test_authors_yml_not_found(self):
-        """
-        Test that no authors page content is generated if .authors.yml is missing.
-        """
-        self.plugin.on_pre_build(self.config)
-        generated_md = self._get_generated_authors_md_content()
-        self.assertIsNotNone(generated_md)
-        self.assertIn("No authors file found", generated_md)
-
-    def test_authors_yml_empty(self):
-        """
-        Test handling of an empty .authors.yml file.
-        """
-        self._create_authors_yml("")
-        self.plugin.on_pre_build(self.config)
-        generated_md = self._get_generated_authors_md_content()
-        self.assertIsNotNone(generated_md)
-        self.assertIn(
-            "No authors found or an error occurred while loading the authors data.",
-            generated_md,
-        )
+    """
+    authors_yml(yml_content)
 
-    def test_authors_yml_malformed(self):
-        """
-        Test handling of a malformed .authors.yml file.
-        """
-        self._create_authors_yml("not: valid: yaml")
-        self.plugin.on_pre_build(self.config)
-        generated_md = self._get_generated_authors_md_content()
-        self.assertIsNotNone(generated_md)
-        self.assertIn(
-            "No authors found or an error occurred while loading the authors data.",
-            generated_md,
-        )
+    plugin.on_pre_build(mkdocs_config)
 
-    def test_authors_yml_wrong_top_level_key(self):
-        """
-        Test handling of .authors.yml with an incorrect top-level key.
-        """
-        yml_content = """
-contributors:
-  author_one:
-    name: Author One
-        """
-        self._create_authors_yml(yml_content)
-        self.plugin.on_pre_build(self.config)
-        generated_md = self._get_generated_authors_md_content()
-        self.assertIsNotNone(generated_md)
-        self.assertIn(
-            "No authors found or an error occurred while loading the authors data.",
-            generated_md,
-        )
+    generated_md = plugin.on_page_read_source(authors_page, mkdocs_config)
+    assert generated_md is not None
+    missing = [fragment for fragment in SUCCESS_PAGE_FRAGMENTS if fragment not in generated_md]
+    assert not missing, f"Fragments missing from the authors page: {missing}"
+    # Both avatars use the default style (100px square, centered) inside the wrapper paragraph
+    assert generated_md.count(DEFAULT_AVATAR_STYLE) == 2
+    assert generated_md.count('<p style="text-align: center;">') == 2
+    assert "email" not in generated_md
 
-    def test_authors_page_generation_with_custom_title(self):
-        """
-        Test that the authors page uses a custom title defined in .authors.yml.
-        """
-        yml_content = """
-page_params:
-  title: Project Contributors
-authors:
-  author_one:
-    name: Custom Author
-        """
-        self._create_authors_yml(yml_content)
-        self.plugin.on_pre_build(self.config)
-        generated_md = self._get_generated_authors_md_content()
-        self.assertIsNotNone(generated_md)
-        self.assertIn("# Project Contributors", generated_md)
-        self.assertIn("## Custom Author", generated_md)
-        self.assertNotIn("# Our Amazing Authors", generated_md)
-
-    def test_authors_page_generation_with_custom_description(self):
-        """
-        Test that the authors page includes a custom description defined in .authors.yml.
-        """
-        yml_content = """
-page_params:
-  title: Our Team
-  description: This is a test description for the authors page.
-authors:
-  author_one:
-    name: Desc Author
-        """
-        self._create_authors_yml(yml_content)
-        self.plugin.on_pre_build(self.config)
-        generated_md = self._get_generated_authors_md_content()
-        self.assertIsNotNone(generated_md)
-        self.assertIn("# Our Team", generated_md)
-        self.assertIn("This is a test description for the authors page.", generated_md)
-        self.assertIn("## Desc Author", generated_md)
-
-    def test_authors_page_generation_without_description(self):
-        """
-        Test that the authors page does not include a description if not defined.
-        """
-        yml_content = """
-page_params:
-  title: No Desc Team
-authors:
-  author_one:
-    name: NoDesc Author
-        """
-        self._create_authors_yml(yml_content)
-        self.plugin.on_pre_build(self.config)
-        generated_md = self._get_generated_authors_md_content()
-        self.assertIsNotNone(generated_md)
-        self.assertIn("# No Desc Team", generated_md)
-        self.assertIn("## NoDesc Author", generated_md)
-        lines = generated_md.splitlines()
-        title_line_index = -1
-        for i, line in enumerate(lines):
-            if line.startswith("# No Desc Team"):
-                title_line_index = i
-                break
-        self.assertGreaterEqual(title_line_index, 0)
-        found_author_heading = False
-        for i in range(title_line_index + 1, len(lines)):
-            if lines[i].strip():
-                if lines[i].startswith("## NoDesc Author"):
-                    found_author_heading = True
-                break
-        self.assertTrue(found_author_heading, "Should directly follow title with author heading if no description")
-
-    def test_authors_page_generation_with_default_title_if_not_specified(self):
-        """
-        Test that the authors page uses the default title if 'page_params' or 'title' is missing.
-        """
-        yml_content = """
-authors:
-  author_one:
-    name: Default Title Author
-        """
-        self._create_authors_yml(yml_content)
-        self.plugin.on_pre_build(self.config)
-        generated_md = self._get_generated_authors_md_content()
-        self.assertIsNotNone(generated_md)
-        self.assertIn("# Our Amazing Authors", generated_md)
-        self.assertIn("## Default Title Author", generated_md)
-        lines = generated_md.splitlines()
-        title_line_index = -1
-        for i, line in enumerate(lines):
-            if line.startswith("# Our Amazing Authors"):
-                title_line_index = i
-                break
-        self.assertGreaterEqual(title_line_index, 0)
-        found_author_heading = False
-        for i in range(title_line_index + 1, len(lines)):
-            if lines[i].strip():
-                if lines[i].startswith("## Default Title Author"):
-                    found_author_heading = True
-                break
-        self.assertTrue(found_author_heading, "Should directly follow title with author heading if no description")
-
-    def test_authors_yml_page_params_not_a_dict(self):
-        """
-        Test handling of .authors.yml where 'page_params' is not a dictionary.
-        """
-        yml_content = """
+
+def test_authors_yml_not_found(plugin, mkdocs_config, authors_page):
+    """
+    Test that no authors page content is generated if .authors.yml is missing.
+    """
+    plugin.on_pre_build(mkdocs_config)
+    generated_md = plugin.on_page_read_source(authors_page, mkdocs_config)
+    assert generated_md is not None
+    assert "No authors file found" in generated_md
+
+
+def test_authors_yml_path_not_a_directory(mkdocs_config, authors_page, authors_yml):
+    """
+    Test that an authors_file path through a regular file is reported as not
+    found instead of aborting the build.
+    """
+    authors_yml(SINGLE_AUTHOR_YML)
+    nested_plugin = AuthorsPlugin()
+    nested_plugin.load_config({"authors_file": ".authors.yml/.authors.yml"})
+    nested_plugin.on_config(mkdocs_config)
+    nested_plugin.on_pre_build(mkdocs_config)
+    generated_md = nested_plugin.on_page_read_source(authors_page, mkdocs_config)
+    assert generated_md is not None
+    assert "No authors file found" in generated_md
+
+
+@pytest.mark.parametrize(
+    "yml_content, expected_log",
+    [
+        pytest.param("", "should contain a dictionary at the top level", id="empty"),
+        pytest.param("not: valid: yaml", "Error parsing", id="malformed"),
+        pytest.param(
+            "contributors:\n  author_one:\n    name: Author One\n",
+            None,
+            id="wrong_top_level_key",
+        ),
+        pytest.param(
+            "authors:\n  author_one:\n    name: Author One\n  author_two: just a string\n",
+            "should be a dictionary",
+            id="author_entry_not_a_dict",
+        ),
+    ],
+)
+def test_authors_yml_without_usable_authors(
+    plugin, make_plugin, mkdocs_config, authors_page, authors_yml, caplog, yml_content, expected_log
+):
+    """
+    Test handling of .authors.yml files that are empty, malformed, use the
+    wrong top-level key, or contain an author entry that is not a dictionary,
+    and that any problem is reported again on the next build.
+    """
+    authors_yml(yml_content)
+    plugin.on_pre_build(mkdocs_config)
+    generated_md = plugin.on_page_read_source(authors_page, mkdocs_config)
+    assert generated_md is not None
+    assert "No authors found or an error occurred while loading the authors data." in generated_md
+
+    if expected_log is not None:
+        caplog.clear()
+        make_plugin().on_pre_build(mkdocs_config)
+        assert expected_log in caplog.text
+
+
+def test_authors_yml_malformed_parsed_again_on_rebuild(plugin, make_plugin, mkdocs_config, authors_yml):
+    """
+    Test that a malformed .authors.yml is not cached, so the next build parses it again.
+    """
+    authors_yml("not: valid: yaml")
+    plugin.on_pre_build(mkdocs_config)
+
+    with mock.patch.object(plugin_module.yaml, "load", wraps=yaml.load) as load:
+        make_plugin().on_pre_build(mkdocs_config)
+    load.assert_called_once()
+
+
+def test_authors_yml_empty_is_not_parsed(plugin, mkdocs_config, authors_yml):
+    """
+    Test that an empty .authors.yml is reported without being parsed.
+    """
+    authors_yml("")
+    with mock.patch.object(plugin_module.yaml, "load") as load:
+        plugin.on_pre_build(mkdocs_config)
+    load.assert_not_called()
+    assert "No authors found" in plugin.authors_markdown_content
+
+
+@pytest.mark.parametrize(
+    "page_params_yml, author_name, expected_title, expected_description",
+    [
+        pytest.param(
+            "page_params:\n  title: Project Contributors\n",
+            "Custom Author",
+            "Project Contributors",
+            None,
+            id="custom_title",
+        ),
+        pytest.param(
+            "page_params:\n  title: Our Team\n  description: This is a test description for the authors page.\n",
+            "Desc Author",
+            "Our Team",
+            "This is a test description for the authors page.",
+            id="custom_description",
+        ),
+        pytest.param(
+            "page_params:\n  title: No Desc Team\n",
+            "NoDesc Author",
+            "No Desc Team",
+            None,
+            id="without_description",
+        ),
+        pytest.param(
+            "",
+            "Default Title Author",
+            "Our Amazing Authors",
+            None,
+            id="default_title_if_not_specified",
+        ),
+    ],
+)
+def test_authors_page_title_and_description(
+    plugin, mkdocs_config, authors_page, authors_yml, page_params_yml, author_name, expected_title, expected_description
+):
+    """
+    Test that the page title and description come from page_params, falling
+    back to the default title and no description when they are not defined.
+    """
+    authors_yml(f"{page_params_yml}authors:\n  author_one:\n    name: {author_name}\n")
+    plugin.on_pre_build(mkdocs_config)
+    generated_md = plugin.on_page_read_source(authors_page, mkdocs_config)
+    assert generated_md is not None
+    assert f"# {expected_title}" in generated_md
+    assert f"## {author_name}" in generated_md
+    if expected_title != "Our Amazing Authors":
+        assert "# Our Amazing Authors" not in generated_md
+
+    if expected_description is not None:
+        assert expected_description in generated_md
+    else:
+        # Only blank lines may separate the title from the first author heading.
+        title_then_author = rf"^# {re.escape(expected_title)}.*\n(?:[ \t]*\n)*## {re.escape(author_name)}"
+        assert re.search(title_then_author, generated_md, re.M), "Should directly follow title with author heading if no description"
+
+
+def test_authors_yml_page_params_not_a_dict(plugin, make_plugin, mkdocs_config, authors_page, authors_yml, caplog):
+    """
+    Test handling of .authors.yml where 'page_params' is not a dictionary,
+    and that the warning is logged again when the cached page is reused.
+    """
+    yml_content = """
 page_params: "this is a string"
 authors:
   author_one:
     name: Alice
-        """
-        self._create_authors_yml(yml_content)
-        self.plugin.on_pre_build(self.config)
-        generated_md = self._get_generated_authors_md_content()
-        self.assertIsNotNone(generated_md)
-        self.assertIn("# Our Amazing Authors", generated_md)
-        self.assertIn("## Alice", generated_md)
-        self.assertNotIn("this is a string", generated_md)
-
-    def test_avatar_custom_size_from_page_params(self):
-        """
-        Test that avatars are rendered with a custom size defined in page_params.
-        """
-        yml_content = """
-page_params:
-  avatar_size: 150
-authors:
-  author_one:
-    name: Sized Author
-    avatar: path/to/avatar.png
-        """
-        self._create_authors_yml(yml_content)
-        self.plugin.on_pre_build(self.config)
-        generated_md = self._get_generated_authors_md_content()
-        self.assertIsNotNone(generated_md)
-        # Expected style for default alignment (center) but custom size
-        self.assertIn('style="width: 150px; height: 150px; object-fit: cover; border-radius: 0; display: block; margin: 0 auto 10px auto;"', generated_md)
-
-    def test_avatar_custom_shape_circle_from_page_params(self):
-        """
-        Test that avatars are rendered as circles when 'circle' shape is specified in page_params.
-        """
-        yml_content = """
-page_params:
-  avatar_shape: circle
-authors:
-  author_one:
-    name: Circular Author
-    avatar: path/to/avatar.png
-        """
-        self._create_authors_yml(yml_content)
-        self.plugin.on_pre_build(self.config)
-        generated_md = self._get_generated_authors_md_content()
-        self.assertIsNotNone(generated_md)
-        # Expected style for default alignment (center) but custom shape
-        self.assertIn('style="width: 100px; height: 100px; object-fit: cover; border-radius: 50%; display: block; margin: 0 auto 10px auto;"', generated_md)
-
-    def test_avatar_custom_shape_square_from_page_params(self):
-        """
-        Test that avatars are rendered as squares when 'square' shape is specified in page_params.
-        (even though it's default, explicitly test it)
-        """
-        yml_content = """
+    """
+    authors_yml(yml_content)
+    plugin.on_pre_build(mkdocs_config)
+    generated_md = plugin.on_page_read_source(authors_page, mkdocs_config)
+    assert generated_md is not None
+    assert "# Our Amazing Authors" in generated_md
+    assert "## Alice" in generated_md
+    assert "this is a string" not in generated_md
+
+    caplog.clear()
+    make_plugin().on_pre_build(mkdocs_config)
+    assert "'page_params' in '.authors.yml' is not a dictionary" in caplog.text
+
+
+@pytest.mark.parametrize(
+    "page_params_yml, author_yml, expected_style",
+    [
+        pytest.param(
+            "page_params:\n  avatar_size: 150\n",
+            "    name: Sized Author\n    avatar: path/to/avatar.png\n",
+            'style="width: 150px; height: 150px; object-fit: cover; border-radius: 0; display: block; margin: 0 auto 10px auto;"',
+            id="custom_size",
+        ),
+        pytest.param(
+            "page_params:\n  avatar_shape: circle\n",
+            "    name: Circular Author\n    avatar: path/to/avatar.png\n",
+            'style="width: 100px; height: 100px; object-fit: cover; border-radius: 50%; display: block; margin: 0 auto 10px auto;"',
+            id="custom_shape_circle",
+        ),
+        pytest.param(
+            # Square is the default shape, but test it explicitly
+            "page_params:\n  avatar_shape: square\n",
+            "    name: Square Author\n    avatar: path/to/avatar.png\n",
+            DEFAULT_AVATAR_STYLE,
+            id="custom_shape_square",
+        ),
+        pytest.param(
+            "",
+            "    name: Default Avatar Author\n    avatar: path/to/avatar.png\n",
+            DEFAULT_AVATAR_STYLE,
+            id="defaults_when_page_params_missing",
+        ),
+        pytest.param(
+            "page_params:\n  avatar_align: left\n",
+            "    name: Left Aligned Author\n"
+            "    avatar: path/to/left_avatar.png\n"
+            "    affiliation: Left Corp\n"
+            "    description: This is a long description that should wrap around the left-aligned avatar. It provides details about the author's work and contributions to the project.\n",
+            'style="width: 100px; height: 100px; object-fit: cover; border-radius: 0; float: left; margin-right: 15px; margin-bottom: 10px;"',
+            id="alignment_left",
+        ),
+        pytest.param(
+            "page_params:\n  avatar_align: right\n",
+            "    name: Right Aligned Author\n"
+            "    avatar: path/to/right_avatar.png\n"
+            "    affiliation: Right Corp\n"
+            "    description: This is a description that should wrap around the right-aligned avatar. It details the author's role.\n",
+            'style="width: 100px; height: 100px; object-fit: cover; border-radius: 0; float: right; margin-left: 15px; margin-bottom: 10px;"',
+            id="alignment_right",
+        ),
+    ],
+)
+def test_avatar_from_page_params(
+    plugin, mkdocs_config, authors_page, authors_yml, page_params_yml, author_yml, expected_style
+):
+    """
+    Test that avatars use the size, shape, and alignment from page_params,
+    falling back to 100px square, centered avatars when they are missing.
+    Centered avatars are wrapped in a centered paragraph; floated avatars
+    let the text wrap around them and clear the float afterwards.
+    """
+    authors_yml(f"{page_params_yml}authors:\n  author_one:\n{author_yml}")
+    plugin.on_pre_build(mkdocs_config)
+    generated_md = plugin.on_page_read_source(authors_page, mkdocs_config)
+    assert generated_md is not None
+    assert expected_style in generated_md
+
+    floated = "float:" in expected_style
+    assert ('<p style="text-align: center;">' in generated_md) is not floated
+    assert ('<div style="clear: both;"></div>' in generated_md) is floated
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "utf-8-sig"])
+def test_authors_page_generation_non_ascii(plugin, mkdocs_config, authors_page, authors_yml, encoding):
+    """
+    Test that non-ASCII author details survive loading, with or without a UTF-8 BOM.
+    """
+    yml_content = """
 page_params:
-  avatar_shape: square
+  title: Équipe
 authors:
   author_one:
-    name: Square Author
-    avatar: path/to/avatar.png
-        """
-        self._create_authors_yml(yml_content)
-        self.plugin.on_pre_build(self.config)
-        generated_md = self._get_generated_authors_md_content()
-        self.assertIsNotNone(generated_md)
-        # Expected style for default alignment (center) and default shape
-        self.assertIn('style="width: 100px; height: 100px; object-fit: cover; border-radius: 0; display: block; margin: 0 auto 10px auto;"', generated_md)
-
-    def test_avatar_defaults_when_page_params_missing(self):
-        """
-        Test that avatars use default size, shape, and alignment when page_params are missing or incomplete.
-        """
-        yml_content = """
-authors:
-  author_one:
-    name: Default Avatar Author
-    avatar: path/to/avatar.png
-        """
-        self._create_authors_yml(yml_content)
-        self.plugin.on_pre_build(self.config)
-        generated_md = self._get_generated_authors_md_content()
-        self.assertIsNotNone(generated_md)
-        # Expected default style (100px square, centered)
-        self.assertIn('style="width: 100px; height: 100px; object-fit: cover; border-radius: 0; display: block; margin: 0 auto 10px auto;"', generated_md)
-        self.assertIn('<p style="text-align: center;">', generated_md)
-
-    def test_avatar_alignment_left(self):
-        """
-        Test avatar aligns left and text wraps around it.
-        """
-        yml_content = """
+    name: Zoë Ångström
+    affiliation: Universität Zürich
+"""
+    authors_yml(yml_content, encoding=encoding)
+    plugin.on_pre_build(mkdocs_config)
+    generated_md = plugin.on_page_read_source(authors_page, mkdocs_config)
+    assert generated_md is not None
+    assert generated_md.startswith("# Équipe\n")
+    assert "## Zoë Ångström" in generated_md
+    assert "**Affiliation:** Universität Zürich" in generated_md
+
+
+def test_authors_page_identical_with_pure_python_loader(make_plugin, mkdocs_config, authors_yml, monkeypatch):
+    """
+    Test that the SafeLoader fallback, used when PyYAML lacks libyaml, renders the same page.
+    """
+    yml_content = """
 page_params:
+  title: Loader Team
+  avatar_size: 120
   avatar_align: left
-authors:
-  author_one:
-    name: Left Aligned Author
-    avatar: path/to/left_avatar.png
-    affiliation: Left Corp
-    description: This is a long description that should wrap around the left-aligned avatar. It provides details about the author's work and contributions to the project.
-        """
-        self._create_authors_yml(yml_content)
-        self.plugin.on_pre_build(self.config)
-        generated_md = self._get_generated_authors_md_content()
-        self.assertIsNotNone(generated_md)
-        self.assertIn('style="width: 100px; height: 100px; object-fit: cover; border-radius: 0; float: left; margin-right: 15px; margin-bottom: 10px;"', generated_md)
-        self.assertNotIn('<p style="text-align: center;">', generated_md) # Should not be wrapped in a center paragraph
-        self.assertIn('<div style="clear: both;"></div>', generated_md) # Ensure clear is present
-
-    def test_avatar_alignment_right(self):
-        """
-        Test avatar aligns right and text wraps around it.
-        """
-        yml_content = """
-page_params:
-  avatar_align: right
-authors:
-  author_one:
-    name: Right Aligned Author
-    avatar: path/to/right_avatar.png
-    affiliation: Right Corp
-    description: This is a description that should wrap around the right-aligned avatar. It details the author's role.
-        """
-        self._create_authors_yml(yml_content)
-        self.plugin.on_pre_build(self.config)
-        generated_md = self._get_generated_authors_md_content()
-        self.assertIsNotNone(generated_md)
-        self.assertIn('style="width: 100px; height: 100px; object-fit: cover; border-radius: 0; float: right; margin-left: 15px; margin-bottom: 10px;"', generated_md)
-        self.assertNotIn('<p style="text-align: center;">', generated_md) # Should not be wrapped in a center paragraph
-        self.assertIn('<div style="clear: both;"></div>', generated_md) # Ensure clear is present
-
-    def test_on_files_adds_generated_page(self):
-        """
-        Test that on_files correctly adds the generated authors.md to MkDocs files.
-        """
-        yml_content = """
 authors:
   author_one:
     name: Author One
-        """
-        self._create_authors_yml(yml_content)
-        self.plugin.on_pre_build(self.config)
-
-        initial_files = Files(
-            [
-                File("index.md", self.docs_dir, self.site_dir, True),
-                File("about.md", self.docs_dir, self.site_dir, True),
-            ]
-        )
+    avatar: headshot_one.png
+    affiliation: British Antarctic Survey
+    orcid: 0123-4567-8910-1112
+  author_two:
+    name: Author Two
+    github: authortwo
+"""
+    authors_yml(yml_content)
+    default_plugin = make_plugin()
+    default_plugin.on_pre_build(mkdocs_config)
+
+    plugin_module._authors_page_cache.clear()
+    monkeypatch.setattr(plugin_module, "SafeLoader", yaml.SafeLoader)
+    fallback_plugin = make_plugin()
+    fallback_plugin.on_pre_build(mkdocs_config)
+
+    assert fallback_plugin.authors_markdown_content == default_plugin.authors_markdown_content
 
-        updated_files = self.plugin.on_files(initial_files, self.config)
-
-        authors_md_found = False
-        for f in updated_files:
-            if f.src_path == "authors.md":
-                authors_md_found = True
-                self.assertEqual(f.abs_src_path, os.path.join(self.docs_dir, "authors.md"))
-                break
-        self.assertTrue(authors_md_found, "authors.md was not added to MkDocs files.")
-        self.assertEqual(len(updated_files), 3)
-
-    def test_on_files_does_not_duplicate_generated_page(self):
-        """
-        Test that on_files does not add a duplicate if authors.md is already present.
-        """
-        yml_content = """
+
+def test_authors_page_reused_when_authors_yml_unchanged(plugin, make_plugin, mkdocs_config, authors_yml):
+    """
+    Test that an unchanged .authors.yml is not parsed or rendered again on rebuild.
+    """
+    yml_content = """
 authors:
   author_one:
-    name: Author One
-        """
-        self._create_authors_yml(yml_content)
-        self.plugin.on_pre_build(self.config)
-
-        initial_files = Files(
-            [
-                File("index.md", self.docs_dir, self.site_dir, True),
-                File("about.md", self.docs_dir, self.site_dir, True),
-                File("authors.md", self.docs_dir, self.site_dir, True),
-            ]
+    name: Cached Author
+    """
+    authors_yml(yml_content)
+    plugin.on_pre_build(mkdocs_config)
+
+    rebuilt_plugin = make_plugin()
+    with mock.patch.object(AuthorsPlugin, "_generate_markdown_content") as generate:
+        rebuilt_plugin.on_pre_build(mkdocs_config)
+    generate.assert_not_called()
+    assert "## Cached Author" in rebuilt_plugin.authors_markdown_content
+
+
+def test_authors_page_reused_when_authors_yml_touched(plugin, make_plugin, mkdocs_config, authors_yml, caplog):
+    """
+    Test that a new mtime with identical content does not re-render the authors
+    page, but still logs the warnings of the original build.
+    """
+    authors_yml_path = authors_yml(SINGLE_AUTHOR_YML)
+    plugin.on_pre_build(mkdocs_config)
+    stat = os.stat(authors_yml_path)
+    os.utime(authors_yml_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    caplog.clear()
+    rebuilt_plugin = make_plugin()
+    with mock.patch.object(AuthorsPlugin, "_generate_markdown_content") as generate:
+        rebuilt_plugin.on_pre_build(mkdocs_config)
+    generate.assert_not_called()
+    assert "## Author One" in rebuilt_plugin.authors_markdown_content
+    # SINGLE_AUTHOR_YML has no page_params, which is warned about on every build.
+    assert "'page_params' in '.authors.yml' is not a dictionary" in caplog.text
+
+
+def test_authors_page_regenerated_when_authors_yml_changes(plugin, mkdocs_config, authors_page, authors_yml):
+    """
+    Test that editing .authors.yml invalidates the cached authors page.
+    """
+    authors_yml("authors:\n  author_one:\n    name: Old Name\n")
+    plugin.on_pre_build(mkdocs_config)
+    authors_yml("authors:\n  author_one:\n    name: Brand New Name\n")
+    plugin.on_pre_build(mkdocs_config)
+
+    generated_md = plugin.on_page_read_source(authors_page, mkdocs_config)
+    assert "## Brand New Name" in generated_md
+    assert "## Old Name" not in generated_md
+
+
+@pytest.mark.parametrize(
+    "authors_md_exists",
+    [
+        pytest.param(False, id="adds_generated_page"),
+        pytest.param(True, id="does_not_duplicate_generated_page"),
+    ],
+)
+def test_on_files(plugin, mkdocs_config, authors_yml, base_files, authors_md_exists):
+    """
+    Test that on_files adds the generated authors.md to MkDocs files, and does
+    not add a duplicate if authors.md is already present.
+    """
+    authors_yml(SINGLE_AUTHOR_YML)
+    plugin.on_pre_build(mkdocs_config)
+
+    initial_files = Files(list(base_files))
+    existing_authors_md = None
+    if authors_md_exists:
+        existing_authors_md = File(
+            "authors.md", mkdocs_config["docs_dir"], mkdocs_config["site_dir"], True
         )
+        initial_files.append(existing_authors_md)
 
-        updated_files = self.plugin.on_files(initial_files, self.config)
-        self.assertEqual(len(updated_files), 3)
+    updated_files = plugin.on_files(initial_files, mkdocs_config)
 
+    assert len(updated_files) == 3
+    authors_md = updated_files.get_file_from_path("authors.md")
+    assert authors_md is not None, "authors.md was not added to MkDocs files."
+    assert authors_md.abs_src_path == os.path.join(mkdocs_config["docs_dir"], "authors.md")
+    if existing_authors_md is not None:
+        assert authors_md is existing_authors_md
 
-if __name__ == "__main__":
-    unittest.main()
+
+def test_on_page_read_source_serves_only_the_output_page(plugin, mkdocs_config, authors_yml):
+    """
+    Test that on_page_read_source only provides content for the output page.
+    """
+    authors_yml(SINGLE_AUTHOR_YML)
+    plugin.on_pre_build(mkdocs_config)
+
+    docs_dir, site_dir = mkdocs_config["docs_dir"], mkdocs_config["site_dir"]
+    initial_files = Files([File("index.md", docs_dir, site_dir, True)])
+    updated_files = plugin.on_files(initial_files, mkdocs_config)
+
+    authors_page = Page(
+        "authors", updated_files.get_file_from_path("authors.md"), mkdocs_config
+    )
+    index_page = Page(
+        "index", updated_files.get_file_from_path("index.md"), mkdocs_config
+    )
+    assert "## Author One" in plugin.on_page_read_source(authors_page, mkdocs_config)
+    assert plugin.on_page_read_source(index_page, mkdocs_config) is None
+
+
+def test_on_page_read_source_serves_rebuilt_authors_file(plugin, mkdocs_config, authors_yml, base_files):
+    """
+    Test that the authors page is still served when a later plugin replaces
+    the File registered by on_files with a new one for the same path.
+    """
+    authors_yml(SINGLE_AUTHOR_YML)
+    plugin.on_pre_build(mkdocs_config)
+    plugin.on_files(Files(list(base_files)), mkdocs_config)
+
+    rebuilt_authors_file = File(
+        "authors.md", mkdocs_config["docs_dir"], mkdocs_config["site_dir"], True
+    )
+    rebuilt_page = Page("authors", rebuilt_authors_file, mkdocs_config)
+    assert "## Author One" in plugin.on_page_read_source(rebuilt_page, mkdocs_config)
+
+
+def test_hooks_work_without_on_config(mkdocs_config, authors_page, authors_yml, base_files):
+    """
+    Test that the hooks resolve the authors path and output page themselves
+    when on_config has not been called.
+    """
+    authors_yml(SINGLE_AUTHOR_YML)
+    bare_plugin = AuthorsPlugin()
+    bare_plugin.load_config({})
+    bare_plugin.on_pre_build(mkdocs_config)
+    assert "## Author One" in bare_plugin.on_page_read_source(authors_page, mkdocs_config)
+
+    bare_plugin = AuthorsPlugin()
+    bare_plugin.load_config({})
+    updated_files = bare_plugin.on_files(Files(list(base_files)), mkdocs_config)
+    assert updated_files.get_file_from_path("authors.md") is not None